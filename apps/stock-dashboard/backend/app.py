@@ -1,19 +1,53 @@
 # backend/app.py
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
+from flask_caching import Cache
+from flask_compress import Compress
 import yfinance as yf
 import pandas as pd
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.errors import UndefinedFunction, UndefinedTable
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
+try:
+    import asyncpg
+except ImportError:
+    asyncpg = None
 import os
+import io
+import asyncio
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 import numpy as np
+import orjson
 from config import Config
+from indicators import compute_indicators
+
+# Fail fast on invalid configuration
+Config.validate()
 
 app = Flask(__name__)
 CORS(app)
 
+# Response cache; on-disk so every worker sees the same entries and
+# invalidations (use RedisCache to share it across pods)
+cache = Cache(app, config={
+    "CACHE_TYPE": Config.CACHE_TYPE,
+    "CACHE_DIR": Config.CACHE_DIR,
+    "CACHE_DEFAULT_TIMEOUT": Config.CACHE_TIMEOUT
+})
+
+# Gzip JSON responses above 512 bytes
+app.config.update(
+    COMPRESS_MIMETYPES = ["application/json"],
+    COMPRESS_ALGORITHM = "gzip",
+    COMPRESS_LEVEL = 6,
+    COMPRESS_MIN_SIZE = 512
+)
+Compress(app)
+
 # Configure logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 logging.basicConfig(level = LOG_LEVEL)
@@ -25,22 +59,120 @@ DB_PORT = Config.DB_PORT
 DB_NAME = Config.DB_NAME
 DB_USER = Config.DB_USER
 DB_PASSWORD = Config.DB_PASSWORD
+
+PRICE_COLUMNS = ["time", "ticker", "open", "high", "low", "close", "volume"]
+STORED_INDICATOR_COLUMNS = ["sma_20", "sma_50", "sma_100", "bb_upper", "bb_lower"]
+ROW_COLUMNS = PRICE_COLUMNS + STORED_INDICATOR_COLUMNS
+
+# Keep stored prices; rewrite indicators only where recomputing changed them
+UPSERT_INDICATORS = f"""
+    ON CONFLICT (time, ticker) DO UPDATE SET
+        {', '.join(f"{col} = EXCLUDED.{col}" for col in STORED_INDICATOR_COLUMNS)}
+    WHERE ({', '.join(f"stock_prices.{col}" for col in STORED_INDICATOR_COLUMNS)})
+        IS DISTINCT FROM
+        ({', '.join(f"EXCLUDED.{col}" for col in STORED_INDICATOR_COLUMNS)});
+"""
                            
+# Connection pool, created on first use so the app can start before the DB
+POOL = None
+POOL_LOCK = threading.Lock()
+
+# ids of pooled connections that already hold prepared statements
+PREPARED_CONNECTIONS = set()
+
 def get_db_connection():
-    """Get database connection"""
+    """Get database connection from the pool"""
+    global POOL
     try:
-        conn = psycopg2.connect(
-            host = DB_HOST,
-            port = DB_PORT,
-            database = DB_NAME,
-            user = DB_USER,
-            password = DB_PASSWORD
-        )
-        return conn
+        if POOL is None:
+            with POOL_LOCK:
+                if POOL is None:
+                    POOL = ThreadedConnectionPool(
+                        minconn = Config.DB_POOL_MIN,
+                        maxconn = Config.DB_POOL_MAX,
+                        host = DB_HOST,
+                        port = DB_PORT,
+                        database = DB_NAME,
+                        user = DB_USER,
+                        password = DB_PASSWORD,
+                        connect_timeout = Config.DB_CONNECT_TIMEOUT
+                    )
+        return POOL.getconn()
     except Exception as e:
         logger.error(f"Database Connection failed: {e}")
         return None
+
+def release_db_connection(conn):
+    """Return database connection to the pool"""
+    if conn is not None and POOL is not None:
+        POOL.putconn(conn, close = bool(conn.closed))
+        # The pool closes connections beyond minconn; forget their statements
+        if conn.closed:
+            PREPARED_CONNECTIONS.discard(id(conn))
+
+def prepare_statements(conn):
+    """PREPARE hot queries once per pooled connection
+
+    Connections above minconn are closed on release, so under bursts the
+    pool reconnects and prepares again on each new connection.
+    """
+    if id(conn) in PREPARED_CONNECTIONS:
+        return
+
+    cur = conn.cursor()
+    try:
+        cur.execute("""
+            PREPARE indicators_q (TEXT, BIGINT) AS
+            SELECT time AT TIME ZONE 'UTC' AS time, close, volume,
+                   sma_20, sma_50, sma_100, bb_upper, bb_lower
+            FROM stock_prices
+            WHERE ticker = $1
+            ORDER BY stock_prices.time DESC
+            LIMIT $2;
+        """)
+    finally:
+        cur.close()
+    PREPARED_CONNECTIONS.add(id(conn))
+
+def close_pool():
+    """Close every pooled connection, e.g. in a parent process before forking"""
+    global POOL
+    with POOL_LOCK:
+        if POOL is not None:
+            POOL.closeall()
+            POOL = None
+    PREPARED_CONNECTIONS.clear()
+
+@contextmanager
+def db_conn(autocommit = False):
+    """Borrow a pooled connection for the duration of a with block
+
+    Read handlers pass autocommit=True so no transaction is left open and
+    putconn() does not have to spend a round trip rolling it back.
+    """
+    conn = get_db_connection()
+    if conn is not None:
+        conn.autocommit = autocommit
+    try:
+        yield conn
+    finally:
+        # Hand the connection back in the mode every other borrower expects
+        if conn is not None and conn.autocommit and not conn.closed:
+            conn.autocommit = False
+        release_db_connection(conn)
     
+def try_timescale(cur, sql):
+    """Run a TimescaleDB-only statement without aborting the transaction"""
+    cur.execute("SAVEPOINT timescale;")
+    try:
+        cur.execute(sql)
+        cur.execute("RELEASE SAVEPOINT timescale;")
+        return True
+    except psycopg2.Error as e:
+        cur.execute("ROLLBACK TO SAVEPOINT timescale;")
+        logger.debug(f"TimescaleDB statement skipped: {e}")
+        return False
+
 def init_db():
     """Finalize database tables"""
     conn = get_db_connection()
@@ -52,43 +184,300 @@ def init_db():
     
     try:
         # Create extension for TimescaleDB (if available)
-        cur.execute("CREATE EXTENSION IF NOT EXISTS timescaledb;")
+        timescale = try_timescale(cur, "CREATE EXTENSION IF NOT EXISTS timescaledb;")
 
         # Create hypertable for stock prices
         cur.execute("""
             CREATE TABLE IF NOT EXISTS stock_prices (
-                time TIMESTAMPZ NOT NULL,
+                time TIMESTAMPTZ NOT NULL,
                 ticker TEXT NOT NULL,
                 open FLOAT,
                 high FLOAT,
                 low FLOAT,
                 close FLOAT,
-                volume BIGINT
+                volume BIGINT,
+                PRIMARY KEY (time, ticker)
             );
         """)
 
+        # Indicator columns, populated on ingest
+        cur.execute("""
+            ALTER TABLE stock_prices
+                ADD COLUMN IF NOT EXISTS sma_20 FLOAT,
+                ADD COLUMN IF NOT EXISTS sma_50 FLOAT,
+                ADD COLUMN IF NOT EXISTS sma_100 FLOAT,
+                ADD COLUMN IF NOT EXISTS bb_upper FLOAT,
+                ADD COLUMN IF NOT EXISTS bb_lower FLOAT;
+        """)
+
         # Create hypertable if TimescaleDB available
-        try:
-            cur.execute("""
-                SELECT create_hypertable('stock_prices', 'time' if_not_exists => TRUE);
+        if timescale:
+            timescale = try_timescale(cur, """
+                SELECT create_hypertable('stock_prices', 'time', if_not_exists => TRUE);
             """)
-
-        except:
+        if not timescale:
             logger.info("TimescaleDB not available using regular table")
         
-        # Create index
+        # Covering index so indicator reads can be index-only scans
         cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_stock_prices_ticker_time ON stock_prices (ticker, time DESC);
+            CREATE INDEX IF NOT EXISTS idx_ticker_time_ind ON stock_prices (ticker, time DESC)
+                INCLUDE (close, volume, sma_20, sma_50, sma_100, bb_upper, bb_lower);
         """)
 
+        # Older indexes with the same key or a prefix of it; drop them so
+        # writes maintain one B-tree
+        cur.execute("DROP INDEX IF EXISTS idx_stock_prices_ticker;")
+        cur.execute("DROP INDEX IF EXISTS idx_stock_prices_ticker_time;")
+        cur.execute("DROP INDEX IF EXISTS idx_ticker_time_cov;")
+
+        # Incrementally maintained per-ticker summary for /api/tickers
+        if timescale and try_timescale(cur, """
+            CREATE MATERIALIZED VIEW IF NOT EXISTS ticker_summary
+            WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+            SELECT time_bucket(INTERVAL '30 days', time) AS bucket,
+                   ticker,
+                   COUNT(*) AS data_points,
+                   MAX(time) AS last_updated
+            FROM stock_prices
+            GROUP BY bucket, ticker
+            WITH NO DATA;
+        """):
+            try_timescale(cur, """
+                SELECT add_continuous_aggregate_policy('ticker_summary',
+                    start_offset => NULL,
+                    end_offset => INTERVAL '1 hour',
+                    schedule_interval => INTERVAL '1 hour',
+                    if_not_exists => TRUE);
+            """)
+
         conn.commit()
+
+        # Backfill indicators only for tickers with rows still missing them:
+        # a w-day window leaves exactly w - 1 leading NULLs per ticker
+        cur.execute("""
+            SELECT ticker
+            FROM stock_prices
+            GROUP BY ticker
+            HAVING COUNT(sma_20) < COUNT(close) - 19
+                OR COUNT(sma_50) < COUNT(close) - 49
+                OR COUNT(sma_100) < COUNT(close) - 99;
+        """)
+        tickers = [row[0] for row in cur.fetchall()]
+        if tickers:
+            store_prices(conn, merge_indicators(conn, pd.DataFrame(columns = PRICE_COLUMNS), tickers))
+
         logger.info("Database initialized successfully")
     
     except Exception as e:
         logger.error(f"Database initialization error: {e}")
     finally:
         cur.close()
-        conn.close()
+        release_db_connection(conn)
+
+def price_records(df, ticker):
+    """Shape a yfinance OHLCV frame into stock_prices rows (missing volume is NULL)"""
+    return pd.DataFrame({
+        "time": df.index,
+        "ticker": ticker,
+        "open": df["Open"].astype(float).to_numpy(),
+        "high": df["High"].astype(float).to_numpy(),
+        "low": df["Low"].astype(float).to_numpy(),
+        "close": df["Close"].astype(float).to_numpy(),
+        "volume": df["Volume"].astype("Int64").array
+    })
+
+def merge_indicators(conn, records, tickers = None):
+    """Compute indicators over stored history plus the fetched rows
+
+    Stored prices win over fetched ones, as they do on conflict. Returns the
+    fetched rows that are new plus any stored rows whose indicators changed,
+    with every stock_prices column, ready for a single upsert.
+    """
+    if tickers is None:
+        tickers = records["ticker"].unique().tolist()
+
+    cur = conn.cursor()
+    frames = []
+
+    try:
+        for ticker in tickers:
+            cur.execute("""
+                SELECT time, open, high, low, close, volume,
+                       sma_20, sma_50, sma_100, bb_upper, bb_lower
+                FROM stock_prices
+                WHERE ticker = %s
+                ORDER BY time ASC;
+            """, (ticker,))
+            stored = pd.DataFrame(cur.fetchall(), columns = [
+                col for col in ROW_COLUMNS if col != "ticker"
+            ], dtype = object)
+            stored["time"] = pd.to_datetime(stored["time"], utc = True)
+            stored["ticker"] = ticker
+
+            fetched = records[records["ticker"] == ticker].copy()
+            fetched["time"] = pd.to_datetime(fetched["time"], utc = True)
+            fetched = fetched[~fetched["time"].isin(stored["time"])]
+
+            # Concatenating an empty frame is deprecated; reindex restores
+            # the indicator columns a fetched-only frame lacks
+            parts = [part for part in (stored, fetched) if not part.empty] or [stored]
+            frame = pd.concat(parts, ignore_index = True).reindex(columns = ROW_COLUMNS)
+            frame = frame.sort_values("time").drop_duplicates("time").reset_index(drop = True)
+            for col in ["open", "high", "low", "close"] + STORED_INDICATOR_COLUMNS:
+                frame[col] = frame[col].astype(float)
+            frame["volume"] = frame["volume"].astype("Int64")
+
+            # NULL closes would poison the running sums; leave their indicators NULL
+            valid = frame["close"].notna().to_numpy()
+            computed = compute_indicators(frame["close"].to_numpy()[valid])
+
+            changed = ~frame["time"].isin(stored["time"]).to_numpy()
+            for col, values in zip(STORED_INDICATOR_COLUMNS, computed):
+                column = np.full(len(frame), np.nan)
+                column[valid] = values
+                old = frame[col].to_numpy()
+                changed |= ~((old == column) | (np.isnan(old) & np.isnan(column)))
+                frame[col] = column
+
+            if changed.any():
+                frames.append(frame[changed])
+
+    finally:
+        cur.close()
+
+    if not frames:
+        return pd.DataFrame(columns = ROW_COLUMNS)
+    return pd.concat(frames, ignore_index = True)[ROW_COLUMNS]
+
+def record_rows(rows):
+    """Row tuples for drivers that bind parameters; NaN/NA become NULL"""
+    times = [t.to_pydatetime() for t in rows["time"]]
+    values = rows[ROW_COLUMNS[1:]].astype(object)
+    values = values.where(values.notna(), None)
+    return [(t,) + row for t, row in zip(times, values.itertuples(index = False, name = None))]
+
+def store_prices(conn, rows):
+    """Bulk upsert rows, falling back to batched INSERTs if COPY fails"""
+    cur = conn.cursor()
+
+    try:
+        # Stage rows as CSV in memory and load them with a single COPY
+        buf = io.StringIO()
+        rows[ROW_COLUMNS].to_csv(buf, index = False, header = False)
+        buf.seek(0)
+
+        cur.execute("""
+            CREATE TEMP TABLE _stage (LIKE stock_prices INCLUDING DEFAULTS)
+            ON COMMIT DROP;
+        """)
+        cur.copy_expert(
+            f"COPY _stage ({', '.join(ROW_COLUMNS)}) FROM STDIN WITH CSV",
+            buf
+        )
+        cur.execute(f"""
+            INSERT INTO stock_prices ({', '.join(ROW_COLUMNS)})
+                    SELECT {', '.join(ROW_COLUMNS)}
+                    FROM _stage
+                    {UPSERT_INDICATORS}
+        """)
+        conn.commit()
+
+    except psycopg2.Error as e:
+        logger.warning(f"COPY failed, falling back to execute_values: {e}")
+        conn.rollback()
+
+        execute_values(cur, f"""
+            INSERT INTO stock_prices ({', '.join(ROW_COLUMNS)})
+                    VALUES %s
+                    {UPSERT_INDICATORS}
+        """, record_rows(rows), page_size = 500)
+        conn.commit()
+
+    finally:
+        cur.close()
+
+async def copy_prices_binary(rows):
+    """Bulk upsert rows with asyncpg's binary COPY"""
+    conn = await asyncpg.connect(
+        host = DB_HOST,
+        port = DB_PORT,
+        database = DB_NAME,
+        user = DB_USER,
+        password = DB_PASSWORD,
+        timeout = Config.DB_CONNECT_TIMEOUT
+    )
+    try:
+        async with conn.transaction():
+            await conn.execute("""
+                CREATE TEMP TABLE _stage (LIKE stock_prices INCLUDING DEFAULTS)
+                ON COMMIT DROP;
+            """)
+            await conn.copy_records_to_table(
+                "_stage", records = record_rows(rows), columns = ROW_COLUMNS
+            )
+            await conn.execute(f"""
+                INSERT INTO stock_prices ({', '.join(ROW_COLUMNS)})
+                        SELECT {', '.join(ROW_COLUMNS)}
+                        FROM _stage
+                        {UPSERT_INDICATORS}
+            """)
+    finally:
+        await conn.close()
+
+def refresh_ticker_summary(conn, start):
+    """Materialize ticker_summary from start onwards so backfilled rows show up
+
+    Fetched history lands behind the aggregate's watermark, where the
+    real-time union does not look until the policy next runs.
+    """
+    conn.commit()
+    conn.autocommit = True
+    cur = conn.cursor()
+    try:
+        # CALL cannot run inside a transaction block; the window start is
+        # rounded up to a bucket boundary, so pad it by one 30 day bucket
+        cur.execute(
+            "CALL refresh_continuous_aggregate('ticker_summary', %s, NULL);",
+            (start - timedelta(days = 30),)
+        )
+    except (UndefinedFunction, UndefinedTable) as e:
+        # No TimescaleDB or no aggregate: /api/tickers reads the raw table
+        logger.debug(f"ticker_summary refresh skipped: {e}")
+    finally:
+        cur.close()
+        conn.autocommit = False
+
+def load_prices(records):
+    """Store price rows with their indicators in one pass (preferring binary COPY)
+
+    Returns (stored, warning): stored is False if nothing was written, and
+    warning describes a failure after the rows were committed.
+    """
+    with db_conn() as conn:
+        if not conn:
+            return False, None
+        rows = merge_indicators(conn, records)
+        conn.commit()
+
+        # Nothing new and no indicator moved: skip the write entirely
+        stored = rows.empty
+        if not stored and asyncpg is not None:
+            try:
+                asyncio.run(copy_prices_binary(rows))
+                stored = True
+            except Exception as e:
+                logger.warning(f"Binary COPY failed, falling back to psycopg2: {e}")
+        if not stored:
+            store_prices(conn, rows)
+
+        try:
+            refresh_ticker_summary(
+                conn, pd.to_datetime(records["time"], utc = True).min().to_pydatetime()
+            )
+        except Exception as e:
+            logger.warning(f"Prices stored but ticker_summary refresh failed: {e}")
+            return True, f"Prices stored but ticker summary refresh failed: {e}"
+    return True, None
 
 @app.route("/health")
 def health():
@@ -98,11 +487,17 @@ def health():
 @app.route("/ready")
 def ready():
     """Readiness check - verify database connection"""
-    conn = get_db_connection()
-    if conn:
-        conn.close()
-        return jsonify({"status": "ready"}), 200
-    return jsonify({"status": "not ready"})
+    # A pooled connection may be idle against a dead server; round-trip it
+    try:
+        with db_conn(autocommit = True) as conn:
+            if conn:
+                cur = conn.cursor()
+                cur.execute("SELECT 1;")
+                cur.close()
+                return jsonify({"status": "ready"}), 200
+    except psycopg2.Error as e:
+        logger.warning(f"Readiness check failed: {e}")
+    return jsonify({"status": "not ready"}), 503
 
 @app.route("/api/fetch/<ticker>")
 def fetch_stock(ticker):
@@ -118,90 +513,163 @@ def fetch_stock(ticker):
             return jsonify({"error": f"No data found for {ticker}"}), 404
         
         # Store in database
-        conn = get_db_connection()
-        if not conn:
+        stored, warning = load_prices(price_records(df, ticker.upper()))
+        if not stored:
             return jsonify({"error": "Database connection failed"}), 500
-        
-        cur = conn.cursor()
 
-        for idx, row in df.iterrows():
-            cur.execute("""
-                INSERT INTO stock_prices
-                        (time, ticker, open, high, low, close, volume)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT DO NOTHING;
-            """, (
-                idx,
-                ticker.upper(),
-                float(row["Open"]),
-                float(row["High"]),
-                float(row["Low"]),
-                float(row["Close"]),
-                float(row["Volume"])
-            ))
-        
-        conn.commit()
-        cur.close()
-        conn.close()
+        # Drop cached indicators so the next read sees the new rows
+        invalidate_indicators(ticker)
 
-        return jsonify({
+        payload = {
             "ticker": ticker.upper(),
             "rows_imported": len(df),
             "date_range": f"{df.index[0].date()} to {df.index[-1].date()}"
-        })
+        }
+        if warning:
+            payload["warning"] = warning
+        return jsonify(payload)
     
     except Exception as e:
         logger.error(f"Error fetching {ticker}: {e}")
         return jsonify({"error": str(e)}), 500
     
 
+@app.route("/api/fetch_batch/<tickers>")
+def fetch_batch(tickers):
+    """Fetch comma-separated tickers concurrently and store them in one load"""
+    symbols = sorted({t.strip().upper() for t in tickers.split(",") if t.strip()})
+    if not symbols:
+        return jsonify({"error": "No tickers given"}), 400
+
+    try:
+        logger.info(f"Fetching data for {', '.join(symbols)}")
+
+        # Concurrent HTTP fetches; keep exchange timezones like Ticker.history
+        data = yf.download(
+            symbols,
+            period = "1y",
+            group_by = "ticker",
+            threads = True,
+            auto_adjust = True,
+            ignore_tz = False,
+            progress = False
+        )
+
+        if data is None or data.empty:
+            return jsonify({"error": f"No data found for {tickers}"}), 404
+
+        # Flatten (ticker, field) columns to one row per (time, ticker)
+        long = data.stack(level = 0, future_stack = True).dropna(subset = ["Close"])
+        if long.empty:
+            return jsonify({"error": f"No data found for {tickers}"}), 404
+
+        records = price_records(
+            long.droplevel(1),
+            long.index.get_level_values(1).str.upper().to_numpy()
+        )
+
+        # Store all tickers with a single bulk load
+        stored, warning = load_prices(records)
+        if not stored:
+            return jsonify({"error": "Database connection failed"}), 500
+
+        counts = records.groupby("ticker").size()
+        for symbol in counts.index:
+            invalidate_indicators(symbol)
+
+        payload = {
+            "tickers": {symbol: int(n) for symbol, n in counts.items()},
+            "rows_imported": len(records),
+            "missing": [symbol for symbol in symbols if symbol not in counts.index]
+        }
+        if warning:
+            payload["warning"] = warning
+        return jsonify(payload)
+
+    except Exception as e:
+        logger.error(f"Error fetching {tickers}: {e}")
+        return jsonify({"error": str(e)}), 500
+    
+
+INDICATOR_COLUMNS = ["close", "volume", "sma_20", "sma_50", "sma_100",
+                     "bb_mid", "bb_std", "bb_upper", "bb_lower"]
+
+def json_response(payload):
+    """Serialize payload (numpy arrays included) with orjson"""
+    return Response(
+        orjson.dumps(payload, option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC),
+        mimetype = "application/json"
+    )
+
+def indicators_cache_key(ticker, limit = None):
+    """Cache key for an indicators response, scoped to the ticker's generation"""
+    ticker = ticker.upper()
+    generation = cache.get(f"ind-gen:{ticker}") or 0
+    return f"ind:{ticker}:{generation}:{'full' if limit is None else limit}"
+
+def invalidate_indicators(ticker):
+    """Drop every cached indicators response (any limit) for a ticker"""
+    key = f"ind-gen:{ticker.upper()}"
+    cache.set(key, (cache.get(key) or 0) + 1, timeout = 0)
+
 @app.route("/api/indicators/<ticker>")
+@cache.cached(
+    key_prefix = lambda: indicators_cache_key(
+        request.view_args["ticker"], request.args.get("limit", type = int)
+    ),
+    response_filter = lambda response: not isinstance(response, tuple)
+)
 def get_indicators(ticker):
-    """Get stock data with Bollinger Bands and SMAs"""
+    """Get stock data with Bollinger Bands and SMAs
+
+    Indicators are precomputed on ingest. Optional ?limit=N returns only
+    the N most recent rows.
+    """
+    limit = request.args.get("limit", type = int)
+    if limit is not None and limit <= 0:
+        return jsonify({"error": "limit must be a positive integer"}), 400
+
     try:
-        conn = get_db_connection()
-        if not conn:
-            return jsonify({"error": "Database connection failed"}), 500
+        with db_conn(autocommit = True) as conn:
+            if not conn:
+                return jsonify({"error": "Database connection failed"}), 500
         
-        cur = conn.cursor(cursor_factory=RealDictCursor)
+            # Plain tuples: no per-row dict construction
+            cur = conn.cursor()
 
-        # Fetch last 1 year of data
-        cur.execute("""
-            SELECT time, ticker, close, volume
-            FROM stock_prices
-            WHERE ticker = %s
-            ORDER BY time ASC;
-        """, (ticker.upper(),))
+            # Indicators are stored on ingest; a NULL limit returns everything
+            prepare_statements(conn)
+            cur.execute("EXECUTE indicators_q (%s, %s);", (ticker.upper(), limit))
 
-        rows = cur.fetchall()
-        cur.close()
-        conn.close()
+            rows = cur.fetchall()
+            cur.close()
 
         if not rows:
-            return jsonify({"error": f"No data for {ticker}"})
-        
-        # Convert to pandas for calculations
-        df = pd.DataFrame(rows)
-        df["time"] = pd.to_datetime(df["time"])
-        df = df.sort_values("time")
+            return jsonify({"error": f"No data for {ticker}"}), 404
 
-        # Calculate indicators
-        df["sma_20"] = df["close"].rolling(window=20).mean()
-        df["sma_50"] = df["close"].rolling(window=50).mean()
-        df["sma_100"] = df["close"].rolling(window=100).mean()
+        # Rows arrive newest first in index order; flip instead of re-sorting
+        rows.reverse()
+        
+        # One contiguous float64 buffer per price/indicator column; NULLs become
+        # NaN. Volume stays a sequence of BIGINT ints (None for NULL)
+        times, close, volume, *values = zip(*rows)
+        columns = {
+            col: np.array(vals, dtype = np.float64)
+            for col, vals in zip(["close"] + STORED_INDICATOR_COLUMNS, (close, *values))
+        }
+        columns["volume"] = volume
 
         # Bollinger bands (20 day SMA, 2 std dev)
-        df["bb_mid"] = df["close"].rolling(window=20).mean()
-        df["bb_std"] = df["close"].rolling(window=20).std()
-        df["bb_upper"] = df["bb_mid"] + (df["bb_std"] * 2)
-        df["bb_lower"] = df["bb_mid"] - (df["bb_std"] * 2)
+        columns["bb_mid"] = columns["sma_20"]
+        columns["bb_std"] = (columns["bb_upper"] - columns["sma_20"]) / 2
 
-        # Return last 50 rows (most recent)
-        result = df.to_dict("records")
-
-        return jsonify({
+        # Return column-oriented arrays straight from numpy
+        return json_response({
             "ticker": ticker.upper(),
-            "data": result
+            "data": {
+                "time": times,
+                **{col: columns[col] for col in INDICATOR_COLUMNS}
+            }
         })
     
     except Exception as e:
@@ -212,23 +680,35 @@ def get_indicators(ticker):
 def get_tickers():
     """Get list of tickers with data"""
     try:
-        conn = get_db_connection()
-        if not conn:
-            return jsonify({"error": "Database connection failed"}), 500
+        with db_conn(autocommit = True) as conn:
+            if not conn:
+                return jsonify({"error": "Database connection failed"}), 500
         
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-        cur.execute("""
-            SELECT DISTINCT ticker,
-                    COUNT(*) as data_points,
-                    MAX(time) as last_updated
-            FROM stock_prices
-            GROUP BY ticker
-            ORDER BY last_updated DESC;
-        """)
+            cur = conn.cursor(cursor_factory=RealDictCursor)
 
-        rows = cur.fetchall()
-        cur.close()
-        conn.close()
+            # Prefer the continuous aggregate; fall back to the raw table
+            try:
+                cur.execute("""
+                    SELECT ticker,
+                            SUM(data_points)::BIGINT as data_points,
+                            MAX(last_updated) as last_updated
+                    FROM ticker_summary
+                    GROUP BY ticker
+                    ORDER BY last_updated DESC;
+                """)
+            except UndefinedTable:
+                conn.rollback()
+                cur.execute("""
+                    SELECT DISTINCT ticker,
+                            COUNT(*) as data_points,
+                            MAX(time) as last_updated
+                    FROM stock_prices
+                    GROUP BY ticker
+                    ORDER BY last_updated DESC;
+                """)
+
+            rows = cur.fetchall()
+            cur.close()
 
         return jsonify({"tickers": rows})
     
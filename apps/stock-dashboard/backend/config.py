@@ -5,15 +5,26 @@ class Config:
     # Database configuration
     DB_HOST: str = os.getenv("DB_HOST", "postgres")
     DB_PORT: int = int(os.getenv("DB_PORT", "5432"))
-    DB_USER: int = os.getenv("DB_USER", "postgres")
+    DB_USER: str = os.getenv("DB_USER", "postgres")
     DB_PASSWORD: str = os.getenv("DB_PASSWORD", "postgres")
     DB_NAME: str = os.getenv("DB_NAME", "stocks")
+    DATABASE_URL: str = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    # Seconds to wait for a new connection (keep well under the frontend's 30s)
+    DB_CONNECT_TIMEOUT: int = int(os.getenv("DB_CONNECT_TIMEOUT", "5"))
+    # Per-worker pool; minconn stays open for the life of every gunicorn worker
+    DB_POOL_MIN: int = int(os.getenv("DB_POOL_MIN", "2"))
+    DB_POOL_MAX: int = max(int(os.getenv("DB_POOL_MAX", "25")), DB_POOL_MIN)
     
     # Application configuration
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     PORT: int = int(os.getenv("PORT", "8000"))
     ENV: str = os.getenv("ENV", "development")
 
+    # Cache configuration (shared by all gunicorn workers in the container)
+    CACHE_TYPE: str = os.getenv("CACHE_TYPE", "FileSystemCache")
+    CACHE_DIR: str = os.getenv("CACHE_DIR", "/tmp/stock-dashboard-cache")
+    CACHE_TIMEOUT: int = int(os.getenv("CACHE_TIMEOUT", "60"))
+
     # Other to be included
 
     @classmethod
@@ -23,8 +34,3 @@ class Config:
             raise ValueError(f"Invalid ENV: {cls.ENV}")
         if cls.DB_PASSWORD == "password" and cls.ENV == "production":
             raise ValueError("Default DB_PASSWORD used in production!")
-        
-    @property
-    def DATABASE_URL(self):
-        return f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
-        
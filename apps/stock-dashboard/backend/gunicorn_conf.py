@@ -0,0 +1,41 @@
+# backend/gunicorn_conf.py
+import math
+import os
+
+def cpu_limit_workers():
+    """One worker per CPU of the container's cgroup limit (at least one)"""
+    try:
+        # cgroup v2: "<quota> <period>" or "max <period>"
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    try:
+        # cgroup v1: a quota of -1 means unlimited
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+            quota = int(f.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+            period = int(f.read())
+        if quota > 0:
+            return max(1, math.ceil(quota / period))
+    except (OSError, ValueError):
+        pass
+    # No CPU limit; keep memory (about 210 MB per worker) bounded
+    return min(os.cpu_count() or 1, 4)
+
+bind = "0.0.0.0:5000"
+workers = int(os.getenv("GUNICORN_WORKERS") or cpu_limit_workers())
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+worker_class = "gthread"
+timeout = 30
+preload_app = True
+
+def on_starting(server):
+    """Initialize the database once in the master, before workers fork"""
+    from app import close_pool, init_db
+
+    init_db()
+    # Workers must open their own connections
+    close_pool()
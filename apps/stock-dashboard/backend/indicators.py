@@ -0,0 +1,64 @@
+# backend/indicators.py
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba unavailable - run the same kernel as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True)
+def compute_indicators(close):
+    """Compute SMA 20/50/100 and Bollinger Bands (20 day, 2 std dev) in one pass
+
+    Returns (sma_20, sma_50, sma_100, bb_upper, bb_lower); positions before a
+    window is full are NaN.
+    """
+    n = close.shape[0]
+    sma_20 = np.full(n, np.nan)
+    sma_50 = np.full(n, np.nan)
+    sma_100 = np.full(n, np.nan)
+    bb_upper = np.full(n, np.nan)
+    bb_lower = np.full(n, np.nan)
+
+    sum_50 = 0.0
+    sum_100 = 0.0
+    mean_20 = 0.0
+    m2_20 = 0.0
+
+    for i in range(n):
+        x = close[i]
+
+        # Running sums: add the new value, subtract the one leaving the window
+        sum_50 += x
+        sum_100 += x
+        if i >= 50:
+            sum_50 -= close[i - 50]
+        if i >= 100:
+            sum_100 -= close[i - 100]
+
+        # Welford running mean/variance over the 20 day window
+        if i < 20:
+            delta = x - mean_20
+            mean_20 += delta / (i + 1)
+            m2_20 += delta * (x - mean_20)
+        else:
+            old = close[i - 20]
+            new_mean = mean_20 + (x - old) / 20
+            m2_20 += (x - old) * (x - new_mean + old - mean_20)
+            mean_20 = new_mean
+
+        if i >= 19:
+            std_20 = np.sqrt(max(m2_20 / 19, 0.0))
+            sma_20[i] = mean_20
+            bb_upper[i] = mean_20 + (std_20 * 2)
+            bb_lower[i] = mean_20 - (std_20 * 2)
+        if i >= 49:
+            sma_50[i] = sum_50 / 50
+        if i >= 99:
+            sma_100[i] = sum_100 / 100
+
+    return sma_20, sma_50, sma_100, bb_upper, bb_lower
@@ -1,7 +1,8 @@
 # frontend/app.py
 from shiny import App, render, ui, reactive
-from shiny.ui import HTML
+from shinywidgets import output_widget, render_widget
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 import plotly.graph_objects as go
 import logging
@@ -14,6 +15,29 @@ API_URL = os.getenv("BACKEND_URL", "http://backend:5000")
 
 TICKERS = ["AAPL", "GOOGL", "MSFT", "TSLA", "AMD"]
 
+# Shared HTTP session so backend calls reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+REQUEST_TIMEOUT = 10
+# Fetching waits on Yahoo Finance plus the DB load
+FETCH_TIMEOUT = 30
+
+# Rows shown in the data table
+TABLE_ROWS = 20
+
+def load_indicators(ticker, limit=None):
+    """Fetch indicators from the backend as a DataFrame (empty on error status)"""
+    params = {"limit": limit} if limit else None
+    response = SESSION.get(f"{API_URL}/api/indicators/{ticker}", params=params,
+                           timeout=REQUEST_TIMEOUT)
+    if response.status_code != 200:
+        return pd.DataFrame()
+
+    # Columnar JSON: one array per column
+    df = pd.DataFrame(response.json()["data"])
+    df["time"] = pd.to_datetime(df["time"])
+    return df
+
 # Define UI
 app_ui = ui.page_fluid(
     ui.h1("Stock Market Dashboard"),
@@ -33,7 +57,7 @@ app_ui = ui.page_fluid(
     ),
     ui.row(
         ui.column(12,
-                  ui.output_ui("chart")
+                  output_widget("chart")
         )
     ),
     ui.row(
@@ -59,7 +83,8 @@ def server(input, output, session):
             status_message.set(f"Fetching {ticker}...")
 
             # Fetch from backend
-            response = requests.get(f"{API_URL}/api/fetch/{ticker}")
+            response = SESSION.get(f"{API_URL}/api/fetch/{ticker}",
+                                   timeout=FETCH_TIMEOUT)
             if response.status_code == 200:
                 result = response.json()
                 status_message.set(
@@ -72,19 +97,27 @@ def server(input, output, session):
         except Exception as e:
             status_message.set(f"    Error: {str(e)}")
 
-    @render.ui
+    @reactive.Calc
+    def indicators_df():
+        """Fetch full indicator history once per ticker"""
+        ticker = input.ticker()
+
+        try:
+            return load_indicators(ticker)
+
+        except Exception as e:
+            logger.error(f"Indicators error: {e}")
+            return pd.DataFrame()
+
+    @render_widget
     def chart():
         """Render candlestick + Bollinger Bands + SMAs"""
         ticker = input.ticker()
 
         try:
-            response = requests.get(f"{API_URL}/api/indicators/{ticker}")
-            if response.status_code != 200:
+            df = indicators_df()
+            if df.empty:
                 return None
-            
-            data = response.json()["data"]
-            df = pd.DataFrame(data)
-            df["time"] = pd.to_datetime(df["time"])
 
             # Create candlestick chart
             fig = go.Figure()
@@ -152,7 +185,7 @@ def server(input, output, session):
                 )
             )
 
-            return HTML(fig.to_html(include_plotlyjs='cdn', div_id=f'chart-{ticker}'))
+            return fig
 
         except Exception as e:
             logger.error(f"Chart error: {e}")
@@ -164,18 +197,15 @@ def server(input, output, session):
         ticker = input.ticker()
 
         try:
-            response = requests.get(f"{API_URL}/api/indicators/{ticker}")
-
-            if response.status_code != 200:
+            # Only the most recent rows are shown; let the backend trim them
+            df = load_indicators(ticker, limit=TABLE_ROWS)
+            if df.empty:
                 return pd.DataFrame()
-            
-            data = response.json()["data"]
-            df = pd.DataFrame(data)
 
             # Format Columns
             cols = ["time", "close", "sma_20", "sma_50", "sma_100",
                     "bb_upper", "bb_lower"]
-            display_df = df[cols].tail(20).copy()
+            display_df = df[cols].copy()
 
             # Round to 2 decimals
             for col in cols[1:]:
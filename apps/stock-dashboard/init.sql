@@ -10,16 +10,19 @@ CREATE TABLE IF NOT EXISTS stock_prices (
     low FLOAT,
     close FLOAT,
     volume BIGINT,
+    -- Indicators, populated by the backend on ingest
+    sma_20 FLOAT,
+    sma_50 FLOAT,
+    sma_100 FLOAT,
+    bb_upper FLOAT,
+    bb_lower FLOAT,
     PRIMARY KEY (time, ticker)
 );
 
--- Create composite index for fast queries
-CREATE INDEX IF NOT EXISTS idx_stock_prices_ticker_time 
-    ON stock_prices (ticker, time DESC);
-
--- Create index for ticker-only queries
-CREATE INDEX IF NOT EXISTS idx_stock_prices_ticker 
-    ON stock_prices (ticker);
+-- Composite covering index so indicator reads can be index-only scans
+CREATE INDEX IF NOT EXISTS idx_ticker_time_ind
+    ON stock_prices (ticker, time DESC)
+    INCLUDE (close, volume, sma_20, sma_50, sma_100, bb_upper, bb_lower);
 
 -- Grant privileges to postgres user
 GRANT ALL PRIVILEGES ON TABLE stock_prices TO postgres;